@@ -7,23 +7,48 @@ Downloads GGUF models from Hugging Face with better progress tracking
 import os
 import sys
 import argparse
+import asyncio
+import inspect
+import shutil
+import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple
-import hashlib
+from typing import Dict, List, Optional, Tuple
 
+# Enable the Rust-backed hf_transfer downloader when available. This must be
+# set before huggingface_hub is imported, since it reads the flag at import.
 try:
-    from huggingface_hub import hf_hub_download, list_repo_files
-    from tqdm import tqdm
-    HF_HUB_AVAILABLE = True
+    import hf_transfer  # noqa: F401
+    HF_TRANSFER_AVAILABLE = True
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+except ImportError:
+    HF_TRANSFER_AVAILABLE = False
+    os.environ.pop("HF_HUB_ENABLE_HF_TRANSFER", None)
+
+# hf_xet enables chunk-deduplicated downloads from Xet-backed repositories
+try:
+    import hf_xet  # noqa: F401
+    HF_XET_AVAILABLE = True
 except ImportError:
-    HF_HUB_AVAILABLE = False
-    print("⚠️  Warning: huggingface_hub not installed")
-    print("Install with: pip install huggingface-hub tqdm")
+    HF_XET_AVAILABLE = False
+
+# blake3 gives fast multithreaded checksums for models with a "blake3" digest
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# huggingface_hub is imported lazily by _ensure_hf() so that --list and
+# --presets don't pay for it
+_HF_LOADED = False
 
 # ============================================================================
 # Model Definitions
 # ============================================================================
 
+# Entries may also set "blake3" to a hex digest; downloads are verified
+# against it when the blake3 package is installed.
 MODELS = {
     # Fast Tier Models (~1.5B parameters)
     "qwen2.5-1.5b-q5": {
@@ -122,6 +147,19 @@ PRESETS = {
     "qwen3-best": ["qwen3-4b-q6", "qwen3-4b-q8"],
 }
 
+# Lookup tables derived from MODELS/PRESETS, built once at import
+_TIER_INDEX: Dict[str, List[Tuple[str, dict]]] = {}
+for _key, _info in MODELS.items():
+    _TIER_INDEX.setdefault(_info["tier"], []).append((_key, _info))
+
+_PRESET_SIZES: Dict[str, float] = {
+    name: sum(MODELS[m]["size_gb"] for m in models) for name, models in PRESETS.items()
+}
+
+# Filesystems that are slow for large sequential writes and unreliable with
+# huggingface_hub's file locks
+NETWORK_FILESYSTEMS = {"nfs", "nfs4", "cifs", "smbfs", "fuse.sshfs"}
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -134,7 +172,7 @@ def print_header():
 
 def print_models_table():
     """Print available models in a formatted table"""
-    print("\n📦 Available Models:\n")
+    lines = ["\n📦 Available Models:\n"]
 
     tiers = ["fast", "medium", "heavy", "specialized"]
     tier_names = {
@@ -145,41 +183,358 @@ def print_models_table():
     }
 
     for tier in tiers:
-        tier_models = {k: v for k, v in MODELS.items() if v.get("tier") == tier}
+        tier_models = _TIER_INDEX.get(tier)
         if not tier_models:
             continue
 
-        print(f"\n{tier_names.get(tier, tier.upper())}:")
-        print("-" * 60)
+        lines.append(f"\n{tier_names.get(tier, tier.upper())}:")
+        lines.append("-" * 60)
 
-        for key, info in tier_models.items():
+        for key, info in tier_models:
             size_str = f"{info['size_gb']:.1f} GB"
-            print(f"  {key:20s} {size_str:>10s}  {info['description']}")
+            lines.append(f"  {key:20s} {size_str:>10s}  {info['description']}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def print_presets():
     """Print available presets"""
-    print("\n🎯 Available Presets:\n")
+    lines = ["\n🎯 Available Presets:\n"]
     for preset_name, models in PRESETS.items():
-        total_size = sum(MODELS[m]["size_gb"] for m in models)
-        print(f"  {preset_name:15s} {len(models)} models ({total_size:.1f} GB)")
+        total_size = _PRESET_SIZES[preset_name]
+        lines.append(f"  {preset_name:15s} {len(models)} models ({total_size:.1f} GB)")
         for model in models:
-            print(f"    - {model}")
-    print()
+            lines.append(f"    - {model}")
+    lines.append("")
 
-def list_repo_files_safe(repo_id: str, token: str = None) -> List[str]:
-    """Safely list files in a Hugging Face repository"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def parallel_downloads(default: int = 4) -> int:
+    """Read METAMUSES_PARALLEL_DOWNLOADS, falling back to the default if invalid"""
+    value = os.environ.get("METAMUSES_PARALLEL_DOWNLOADS")
+    if value is None:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        print(f"⚠️  Warning: invalid METAMUSES_PARALLEL_DOWNLOADS={value!r}, using {default}")
+        return default
+    if workers < 1:
+        print("⚠️  Warning: METAMUSES_PARALLEL_DOWNLOADS must be at least 1, using 1")
+        return 1
+    return workers
+
+def _ensure_hf():
+    """Import huggingface_hub on first use, exiting if it is not installed"""
+    global _HF_LOADED, HfApi, hf_hub_download, list_repo_files, snapshot_download
+    if _HF_LOADED:
+        return
+
+    try:
+        from huggingface_hub import HfApi, hf_hub_download, list_repo_files, snapshot_download
+        from tqdm import tqdm  # noqa: F401
+    except ImportError:
+        print("❌ Error: huggingface_hub is not installed")
+        print("\nInstall with:")
+        print("  pip install huggingface-hub tqdm")
+        print("\nOr use the bash script: scripts/download-models.sh")
+        sys.exit(1)
+
+    _HF_LOADED = True
+
+def disable_hf_transfer():
+    """Fall back to the default Python downloader"""
+    os.environ.pop("HF_HUB_ENABLE_HF_TRANSFER", None)
+    if _HF_LOADED:
+        from huggingface_hub import constants
+        constants.HF_HUB_ENABLE_HF_TRANSFER = False
+
+def check_disk_space(model_keys: List[str], models_dir: Path, force: bool = False) -> bool:
+    """Check there is enough free space (plus 10% headroom) for the given models"""
+    pending = [
+        m for m in model_keys
+        if m in MODELS and (force or not (models_dir / MODELS[m]["filename"]).exists())
+    ]
+    required = sum(MODELS[m]["size_gb"] for m in pending) * 1024**3 * 1.1
+    free = shutil.disk_usage(models_dir).free
+    if free < required:
+        print(f"❌ Not enough disk space in {models_dir}")
+        print(f"   Required: ~{required / 1024**3:.1f} GB")
+        print(f"   Available: {free / 1024**3:.1f} GB")
+        return False
+    return True
+
+def verify_blake3(path: Path, expected_hex: str) -> bool:
+    """Hash a file with multithreaded BLAKE3 and compare against the expected digest"""
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(str(path))
+    return hasher.hexdigest() == expected_hex.lower()
+
+def check_checksum(model_key: str, path: Path) -> bool:
+    """Verify a downloaded model against its optional "blake3" digest"""
+    expected = MODELS[model_key].get("blake3")
+    if not expected:
+        return True
+    if not BLAKE3_AVAILABLE:
+        print(f"⚠️  Warning: blake3 not installed, skipping checksum for {path.name}")
+        print("   Install with: pip install blake3")
+        return True
+
+    if not verify_blake3(path, expected):
+        print(f"\n❌ Checksum mismatch for {path.name}")
+        # Remove the cached blob too, or the next download would reuse it. Only
+        # new downloads get here from the cache; overwrites are staged files.
+        path.resolve().unlink()
+        path.unlink(missing_ok=True)
+        return False
+    return True
+
+def _flat_file_kwargs() -> dict:
+    """Extra download options so local_dir gets real files rather than symlinks"""
+    # Releases before 0.23 symlink large files from ~/.cache unless told not
+    # to; later ones always write real files and deprecate the option
+    from huggingface_hub import __version__
+    major, minor = (int(part) for part in __version__.split(".")[:2])
+    return {"local_dir_use_symlinks": False} if (major, minor) < (0, 23) else {}
+
+def _progress_kwargs(download_fn, position: Optional[int]) -> dict:
+    """Pin a download's progress bar to its own line when running in parallel"""
+    # hf_hub_download only takes tqdm_class from huggingface_hub 1.0 on
+    if position is None or "tqdm_class" not in inspect.signature(download_fn).parameters:
+        return {}
+    from tqdm import tqdm
+
+    class PositionedTqdm(tqdm):
+        def __init__(self, *args, **kwargs):
+            kwargs["position"] = position
+            kwargs.setdefault("leave", False)
+            super().__init__(*args, **kwargs)
+
+    return {"tqdm_class": PositionedTqdm}
+
+def _link_into_models_dir(cached_path: Path, output_path: Path):
+    """Atomically point models_dir/<filename> at its copy in the models_dir cache"""
+    # Relative links keep working when models_dir is mounted elsewhere
+    tmp_link = output_path.with_name(f".{output_path.name}.link")
+    tmp_link.unlink(missing_ok=True)
+    tmp_link.symlink_to(os.path.relpath(cached_path, output_path.parent))
+    os.replace(tmp_link, output_path)
+
+def _mount_fstype(path: Path) -> Optional[str]:
+    """Find the filesystem type of the mount containing path (Linux only)"""
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return None
+
+    path_str = str(path)
+    best_mount, fstype = "", None
+    for mount_point, mount_fstype in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        inside = path_str == mount_point or path_str.startswith(mount_point.rstrip("/") + "/")
+        # Later entries for the same mount point shadow earlier ones
+        if inside and len(mount_point) >= len(best_mount):
+            best_mount, fstype = mount_point, mount_fstype
+    return fstype
+
+def check_models_dir(models_dir: Path, file_count: int):
+    """Warn if the models directory is on a network mount or low on inodes"""
+    fstype = _mount_fstype(models_dir)
+    if fstype in NETWORK_FILESYSTEMS:
+        print(f"⚠️  Warning: {models_dir} is on a network filesystem ({fstype})")
+        print("   Downloads will be much slower, consider --dir with a local SSD path")
+
+    try:
+        stats = os.statvfs(models_dir)
+    except (AttributeError, OSError):
+        return
+
+    # Each download also creates lock and metadata files; some filesystems
+    # don't report inode counts at all (f_files == 0)
+    if stats.f_files and stats.f_favail < file_count * 4:
+        print(f"⚠️  Warning: only {stats.f_favail} free inodes in {models_dir}")
+
+def is_xet_file(repo_id: str, filename: str, token: str = None) -> Optional[bool]:
+    """Check whether a file is served from Xet storage (None if it can't be told)"""
+    _ensure_hf()
+    try:
+        from huggingface_hub import get_hf_file_metadata, hf_hub_url
+        metadata = get_hf_file_metadata(hf_hub_url(repo_id, filename), token=token)
+    except Exception:
+        return None
+    # Releases before 0.32 don't expose Xet metadata at all
+    if not hasattr(metadata, "xet_file_data"):
+        return None
+    return metadata.xet_file_data is not None
+
+def report_xet(repo_id: str, filenames: List[str], token: str = None):
+    """Show whether each file will be fetched through Xet (for --prefer-xet)"""
+    if not HF_XET_AVAILABLE:
+        return
+    for filename in filenames:
+        xet = is_xet_file(repo_id, filename, token)
+        if xet:
+            print(f"⚡ Using Xet storage for {filename}")
+        elif xet is None:
+            print(f"⚠️  Could not tell whether {filename} is Xet-backed")
+        else:
+            print(f"⚠️  {filename} is not Xet-backed, --prefer-xet has no effect")
+
+def _remote_sizes(repo_id: str, filenames: List[str], token: str = None) -> Dict[str, int]:
+    """Look up file sizes on the Hub, returning an empty dict if unavailable"""
+    _ensure_hf()
+    try:
+        paths = HfApi().get_paths_info(repo_id, filenames, token=token)
+        return {p.path: p.size for p in paths}
+    except Exception:
+        return {}
+
+def is_complete(path: Path, remote_size: int = None) -> bool:
+    """Check an existing download against its remote size (assumed complete if unknown)"""
+    return remote_size is None or path.stat().st_size == remote_size
+
+def _list_gguf_files(repo_id: str, token: str = None) -> Optional[List[str]]:
+    """List GGUF files in a Hugging Face repository, returning None on error"""
+    _ensure_hf()
     try:
         files = list_repo_files(repo_id, token=token)
         return [f for f in files if f.endswith('.gguf')]
     except Exception as e:
         print(f"⚠️  Warning: Could not list files in {repo_id}: {e}")
-        return []
+        return None
+
+def verify_download(model_key: str, path: Path, remote_size: int = None) -> bool:
+    """Check a downloaded file against its remote size and optional checksum"""
+    actual_size = path.stat().st_size
+    if remote_size is not None and actual_size != remote_size:
+        print(f"\n❌ Size mismatch for {path.name}: expected {remote_size} bytes, got {actual_size}")
+        return False
+    return check_checksum(model_key, path)
+
+def list_repo_files_safe(repo_id: str, token: str = None) -> List[str]:
+    """Safely list files in a Hugging Face repository"""
+    return _list_gguf_files(repo_id, token) or []
+
+def plan_downloads(
+    model_keys: List[str],
+    models_dir: Path,
+    token: str = None,
+    force: bool = False,
+    interactive: bool = False
+) -> Dict[str, bool]:
+    """Decide which models to download, mapping each to whether it overwrites a file
+
+    Existing files are skipped unless forced, confirmed interactively, or their
+    size differs from the Hub. This runs on the main thread so prompts never
+    come from download workers.
+    """
+    plan = {}
+    existing: Dict[str, List[str]] = {}
+    for model_key in model_keys:
+        if model_key in MODELS and (models_dir / MODELS[model_key]["filename"]).exists():
+            existing.setdefault(MODELS[model_key]["repo_id"], []).append(model_key)
+        else:
+            plan[model_key] = False
+
+    for repo_id, keys in existing.items():
+        filenames = [MODELS[k]["filename"] for k in keys]
+        remote_sizes = {} if force else _remote_sizes(repo_id, filenames, token)
+        for model_key, filename in zip(keys, filenames):
+            if force:
+                plan[model_key] = True
+            elif not is_complete(models_dir / filename, remote_sizes.get(filename)):
+                # huggingface_hub can't resume a finished file, so replace it
+                print(f"⚠️  Existing file is incomplete, re-downloading: {filename}")
+                plan[model_key] = True
+            else:
+                print(f"✓ Model already exists: {filename}")
+                if interactive and input("  Overwrite? (y/N): ").strip().lower() == 'y':
+                    plan[model_key] = True
+                else:
+                    print("  Skipping...")
+
+    return {k: plan[k] for k in model_keys if k in plan}
+
+def list_repo_files_batch(
+    repo_ids: List[str],
+    token: str = None,
+    max_workers: int = 20
+) -> Dict[str, Optional[List[str]]]:
+    """List GGUF files in several repositories concurrently (None where listing failed)"""
+    _ensure_hf()
+    repo_ids = list(dict.fromkeys(repo_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda r: _list_gguf_files(r, token), repo_ids)
+        return dict(zip(repo_ids, results))
+
+def validate_models(token: str = None) -> Tuple[int, int]:
+    """Check that every model file exists in its repository
+
+    Returns the number of missing models and the number that could not be
+    checked because their repository listing failed.
+    """
+    print("🔍 Validating model definitions...\n")
+    repo_files = list_repo_files_batch([info["repo_id"] for info in MODELS.values()], token)
+
+    missing_count = 0
+    unlisted_count = 0
+    for key, info in MODELS.items():
+        files = repo_files[info["repo_id"]]
+        if files is None:
+            print(f"  ⚠️  {key}: could not list {info['repo_id']}")
+            unlisted_count += 1
+        elif info["filename"] in files:
+            print(f"  ✓ {key}")
+        else:
+            print(f"  ❌ {key}: {info['filename']} not found in {info['repo_id']}")
+            missing_count += 1
+
+    print()
+    return missing_count, unlisted_count
+
+async def list_repo_files_async(session, repo_id: str, token: str = None) -> Optional[List[str]]:
+    """List GGUF files in a repository over a shared aiohttp session, returning None on error"""
+    url = f"https://huggingface.co/api/models/{repo_id}/tree/main?recursive=true"
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    files = []
+    try:
+        # Large listings are paginated via the Link header
+        while url:
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                entries = await response.json()
+                next_link = response.links.get("next")
+            files.extend(
+                e["path"] for e in entries
+                if e.get("type") == "file" and e["path"].endswith('.gguf')
+            )
+            url = str(next_link["url"]) if next_link else None
+        return files
+    except Exception as e:
+        print(f"⚠️  Warning: Could not list files in {repo_id}: {e}")
+        return None
+
+async def _browse_all(token: str = None) -> Dict[str, Optional[List[str]]]:
+    """List GGUF files in every repository referenced by MODELS"""
+    import aiohttp
+
+    repo_ids = list(dict.fromkeys(info["repo_id"] for info in MODELS.values()))
+    connector = aiohttp.TCPConnector(limit=20)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *(list_repo_files_async(session, repo_id, token) for repo_id in repo_ids)
+        )
+    return dict(zip(repo_ids, results))
 
 def download_model(
     model_key: str,
     models_dir: Path,
     token: str = None,
-    force: bool = False
+    force: bool = False,
+    prefer_xet: bool = False,
+    interactive: bool = False,
+    cache_layout: bool = False,
+    position: Optional[int] = None
 ) -> bool:
     """Download a single model"""
 
@@ -188,6 +543,8 @@ def download_model(
         print(f"   Run with --list to see available models")
         return False
 
+    _ensure_hf()
+
     info = MODELS[model_key]
     repo_id = info["repo_id"]
     filename = info["filename"]
@@ -204,27 +561,58 @@ def download_model(
     output_path = models_dir / filename
 
     # Check if already exists
-    if output_path.exists() and not force:
-        print(f"✓ Model already exists: {filename}")
-        response = input("  Overwrite? (y/N): ").strip().lower()
-        if response != 'y':
-            print("  Skipping...")
-            return True
-        output_path.unlink()
+    plan = plan_downloads([model_key], models_dir, token, force, interactive)
+    if model_key not in plan:
+        return True
+    overwrite = plan[model_key]
+
+    if not check_disk_space([model_key], models_dir, force=True):
+        return False
+
+    if prefer_xet:
+        report_xet(repo_id, [filename], token)
+
+    # Overwrites go to a staging directory next to the model, are verified, and
+    # are then moved into place atomically, so a failed or bad download never
+    # leaves the model missing. The name is stable so an interrupted overwrite
+    # resumes on the next run. In --cache-layout the verified file replaces the
+    # blob the existing link points at, since the cache would otherwise
+    # overwrite that blob before it could be checked.
+    atomic = overwrite and output_path.exists()
+    if atomic or not cache_layout:
+        download_dir = models_dir / f".{filename}.partial" if atomic else models_dir
+        location = {"local_dir": str(download_dir), **_flat_file_kwargs()}
+        force_download = overwrite and not atomic
+    else:
+        # New files in --cache-layout are stored in a Hugging Face cache inside
+        # models_dir and symlinked into place
+        location = {"cache_dir": str(models_dir)}
+        force_download = False
+    finished = False
 
     # Download using huggingface_hub
     try:
-        downloaded_path = hf_hub_download(
+        downloaded_path = Path(hf_hub_download(
             repo_id=repo_id,
             filename=filename,
-            local_dir=str(models_dir),
-            local_dir_use_symlinks=False,
             token=token,
+            force_download=force_download,
             resume_download=True,
-        )
+            **location,
+            **_progress_kwargs(hf_hub_download, position),
+        ))
+        finished = True
+        remote_size = _remote_sizes(repo_id, [filename], token).get(filename)
+        if not verify_download(model_key, downloaded_path, remote_size):
+            return False
+        if atomic:
+            target = output_path.resolve() if output_path.is_symlink() else output_path
+            os.replace(downloaded_path, target)
+        elif cache_layout:
+            _link_into_models_dir(downloaded_path, output_path)
 
         # Verify file size
-        actual_size = Path(downloaded_path).stat().st_size / (1024**3)  # GB
+        actual_size = output_path.stat().st_size / (1024**3)  # GB
         print(f"\n✓ Successfully downloaded: {filename} ({actual_size:.2f} GB)")
         return True
 
@@ -232,11 +620,165 @@ def download_model(
         print(f"\n❌ Failed to download {filename}: {e}")
         return False
 
+    finally:
+        if atomic and finished:
+            shutil.rmtree(download_dir, ignore_errors=True)
+
+def download_repo_group(
+    model_keys: List[str],
+    models_dir: Path,
+    token: str = None,
+    prefer_xet: bool = False,
+    cache_layout: bool = False,
+    position: Optional[int] = None
+) -> Dict[str, bool]:
+    """Download several new models from the same repository in one snapshot call
+
+    Returns whether each model key succeeded. If the batched call fails, each
+    file is retried on its own so one bad file doesn't sink the whole group.
+    """
+
+    repo_id = MODELS[model_keys[0]]["repo_id"]
+    filenames = [MODELS[k]["filename"] for k in model_keys]
+    total_size = sum(MODELS[k]["size_gb"] for k in model_keys)
+
+    print(f"\n{'='*60}")
+    print(f"📥 Downloading {len(filenames)} files from: {repo_id}")
+    for filename in filenames:
+        print(f"   File: {filename}")
+    print(f"   Size: ~{total_size:.1f} GB")
+    print(f"{'='*60}\n")
+
+    if prefer_xet:
+        report_xet(repo_id, filenames, token)
+
+    location = (
+        {"cache_dir": str(models_dir)} if cache_layout
+        else {"local_dir": str(models_dir), **_flat_file_kwargs()}
+    )
+    try:
+        snapshot_dir = Path(snapshot_download(
+            repo_id=repo_id,
+            allow_patterns=filenames,
+            max_workers=8,
+            token=token,
+            **location,
+            **_progress_kwargs(snapshot_download, position),
+        ))
+    except Exception as e:
+        print(f"\n⚠️  Batched download from {repo_id} failed: {e}")
+        print("   Retrying files individually...")
+        return {
+            k: download_model(
+                k, models_dir, token, prefer_xet=prefer_xet, cache_layout=cache_layout,
+                position=position
+            )
+            for k in model_keys
+        }
+
+    results = {}
+    remote_sizes = _remote_sizes(repo_id, filenames, token)
+    for model_key, filename in zip(model_keys, filenames):
+        path = snapshot_dir / filename
+        results[model_key] = path.exists() and verify_download(
+            model_key, path, remote_sizes.get(filename)
+        )
+        if results[model_key]:
+            if cache_layout:
+                _link_into_models_dir(path, models_dir / filename)
+            actual_size = path.stat().st_size / (1024**3)  # GB
+            print(f"\n✓ Successfully downloaded: {filename} ({actual_size:.2f} GB)")
+        elif not path.exists():
+            print(f"\n❌ Failed to download {filename}: not found after download")
+    return results
+
+def download_models_grouped(
+    model_keys: List[str],
+    models_dir: Path,
+    token: str = None,
+    force: bool = False,
+    prefer_xet: bool = False,
+    interactive: bool = False,
+    cache_layout: bool = False
+) -> Tuple[int, int]:
+    """Download models in parallel, batching new files that share a repository"""
+
+    # Resolve existing files (and any prompts) before starting workers
+    plan = plan_downloads(model_keys, models_dir, token, force, interactive)
+    success_count = len(model_keys) - len(plan)
+    fail_count = 0
+
+    # Overwrites are downloaded one by one; new files are grouped by repository
+    # and unknown keys go through download_model to report them
+    groups: List[List[str]] = []
+    by_repo: Dict[str, List[str]] = {}
+    for model_key, overwrite in plan.items():
+        if overwrite or model_key not in MODELS:
+            groups.append([model_key])
+        else:
+            by_repo.setdefault(MODELS[model_key]["repo_id"], []).append(model_key)
+    groups.extend(by_repo.values())
+
+    max_workers = parallel_downloads()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    # Cancel pending downloads on Ctrl+C instead of leaving them running
+    def handle_sigint(signum, frame):
+        print("\n\n⚠️  Interrupted, cancelling downloads...")
+        print("   Partial downloads are kept and resume on the next run")
+        executor.shutdown(wait=False, cancel_futures=True)
+        # os._exit() skips the usual flush, so push the message out first
+        sys.stdout.flush()
+        os._exit(130)
+
+    previous_handler = signal.signal(signal.SIGINT, handle_sigint)
+    try:
+        futures = {}
+        for position, keys in enumerate(groups):
+            if len(keys) == 1:
+                future = executor.submit(
+                    download_model,
+                    keys[0], models_dir, token, plan[keys[0]], prefer_xet, False, cache_layout,
+                    position
+                )
+            else:
+                future = executor.submit(
+                    download_repo_group, keys, models_dir, token, prefer_xet, cache_layout, position
+                )
+            futures[future] = keys
+
+        for i, future in enumerate(as_completed(futures), 1):
+            keys = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"\n❌ Failed to download {', '.join(keys)}: {e}")
+                results = False
+            # download_model() returns one bool, download_repo_group() one per key
+            if not isinstance(results, dict):
+                results = {k: results for k in keys}
+
+            statuses = [f"{k}: {'done' if results[k] else 'failed'}" for k in keys]
+            print(f"\n[{i}/{len(futures)}] {', '.join(statuses)}")
+            for model_key in keys:
+                if results[model_key]:
+                    success_count += 1
+                else:
+                    fail_count += 1
+    finally:
+        executor.shutdown(wait=True)
+        signal.signal(signal.SIGINT, previous_handler)
+
+    return success_count, fail_count
+
 def download_preset(
     preset_name: str,
     models_dir: Path,
     token: str = None,
-    force: bool = False
+    force: bool = False,
+    prefer_xet: bool = False,
+    interactive: bool = False,
+    cache_layout: bool = False
 ) -> Tuple[int, int]:
     """Download a preset collection of models"""
 
@@ -245,48 +787,57 @@ def download_preset(
         print(f"   Available presets: {', '.join(PRESETS.keys())}")
         return 0, 0
 
+    _ensure_hf()
+
     models = PRESETS[preset_name]
-    total_size = sum(MODELS[m]["size_gb"] for m in models)
+    total_size = _PRESET_SIZES[preset_name]
 
     print(f"\n🎯 Downloading preset: {preset_name}")
     print(f"   Models: {len(models)}")
     print(f"   Total size: ~{total_size:.1f} GB")
 
-    success_count = 0
-    fail_count = 0
-
-    for i, model_key in enumerate(models, 1):
-        print(f"\n[{i}/{len(models)}] ", end="")
-        if download_model(model_key, models_dir, token, force):
-            success_count += 1
-        else:
-            fail_count += 1
+    if not check_disk_space(models, models_dir, force):
+        sys.exit(1)
 
-    return success_count, fail_count
+    return download_models_grouped(
+        models, models_dir, token, force, prefer_xet, interactive, cache_layout
+    )
 
 def show_summary(models_dir: Path):
     """Show download summary"""
-    print(f"\n{'='*60}")
-    print("📊 Download Summary")
-    print(f"{'='*60}\n")
+    lines = [
+        f"\n{'='*60}",
+        "📊 Download Summary",
+        f"{'='*60}\n",
+    ]
 
-    print(f"Models directory: {models_dir}")
-    print("\nDownloaded models:")
+    lines.append(f"Models directory: {models_dir}")
+    lines.append("\nDownloaded models:")
 
-    total_size = 0
-    for file in sorted(models_dir.glob("*.gguf")):
-        size_bytes = file.stat().st_size
-        size_gb = size_bytes / (1024**3)
-        total_size += size_gb
-        print(f"  {file.name:50s} {size_gb:>6.2f} GB")
+    # DirEntry.stat() reuses data from the directory read where possible
+    with os.scandir(models_dir) as it:
+        entries = sorted((e for e in it if e.name.endswith(".gguf")), key=lambda e: e.name)
 
-    print(f"\n  Total: {total_size:.2f} GB")
+    total_bytes = 0
+    for entry in entries:
+        try:
+            size_bytes = entry.stat().st_size
+        except FileNotFoundError:
+            # Dangling symlink, e.g. after pruning the models--* cache folders
+            lines.append(f"  {entry.name:50s} ⚠️  broken link")
+            continue
+        total_bytes += size_bytes
+        lines.append(f"  {entry.name:50s} {size_bytes / (1024**3):>6.2f} GB")
 
-    print("\n📝 Next steps:")
-    print(f"  1. Update .env: MODELS_DIR={models_dir}")
-    print("  2. Configure model tiers in src/inference/models.rs")
-    print("  3. Start API: cargo run --bin metamuse-server")
-    print()
+    lines.append(f"\n  Total: {total_bytes / (1024**3):.2f} GB")
+
+    lines.append("\n📝 Next steps:")
+    lines.append(f"  1. Update .env: MODELS_DIR={models_dir}")
+    lines.append("  2. Configure model tiers in src/inference/models.rs")
+    lines.append("  3. Start API: cargo run --bin metamuse-server")
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ============================================================================
 # Main Script
@@ -332,24 +883,54 @@ def main():
         action="store_true",
         help="Force re-download even if file exists",
     )
+    parser.add_argument(
+        "--cache-layout",
+        action="store_true",
+        help="Keep a HF cache inside the models directory and symlink .gguf files into it",
+    )
+    parser.add_argument(
+        "-i", "--interactive",
+        action="store_true",
+        help="Ask before overwriting existing files (default: skip them)",
+    )
     parser.add_argument(
         "--browse",
         metavar="REPO_ID",
         help="Browse GGUF files in a Hugging Face repository",
     )
+    parser.add_argument(
+        "--list-all-remote",
+        action="store_true",
+        help="Browse GGUF files in every repository used by the model list",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Check that every model file exists in its repository",
+    )
+    parser.add_argument(
+        "--no-hf-transfer",
+        action="store_true",
+        help="Disable the hf_transfer accelerated downloader",
+    )
+    parser.add_argument(
+        "--prefer-xet",
+        action="store_true",
+        help="Report which files are fetched through Xet and warn where it has no effect "
+             "(Xet is used automatically whenever hf_xet is installed)",
+    )
 
     args = parser.parse_args()
 
     # Print header
     print_header()
 
-    # Check if huggingface_hub is available
-    if not HF_HUB_AVAILABLE:
-        print("❌ Error: huggingface_hub is not installed")
-        print("\nInstall with:")
-        print("  pip install huggingface-hub tqdm")
-        print("\nOr use the bash script: scripts/download-models.sh")
-        sys.exit(1)
+    if args.no_hf_transfer:
+        disable_hf_transfer()
+
+    if args.prefer_xet and not HF_XET_AVAILABLE:
+        print("⚠️  Warning: hf_xet not installed, --prefer-xet has no effect")
+        print("   Install with: pip install hf_xet")
 
     # Handle list option
     if args.list:
@@ -363,6 +944,7 @@ def main():
 
     # Handle browse option
     if args.browse:
+        _ensure_hf()
         print(f"📂 Browsing GGUF files in: {args.browse}\n")
         files = list_repo_files_safe(args.browse, args.token)
         if files:
@@ -375,9 +957,53 @@ def main():
     # Get token from environment if not provided
     token = args.token or os.environ.get("HF_TOKEN")
 
+    # Handle list-all-remote option
+    if args.list_all_remote:
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            print("❌ Error: aiohttp is not installed")
+            print("\nInstall with:")
+            print("  pip install aiohttp")
+            sys.exit(1)
+
+        listings = asyncio.run(_browse_all(token))
+        for repo_id, files in listings.items():
+            print(f"📂 {repo_id}")
+            if files is None:
+                print("  ⚠️  Could not list repository")
+            elif files:
+                for i, file in enumerate(files, 1):
+                    print(f"  {i}. {file}")
+            else:
+                print("  No GGUF files found")
+            print()
+        unlisted_count = sum(files is None for files in listings.values())
+        if unlisted_count:
+            print(f"⚠️  {unlisted_count} of {len(listings)} repositories could not be listed")
+            sys.exit(1)
+        return
+
+    # Handle validate option
+    if args.validate:
+        missing_count, unlisted_count = validate_models(token)
+        if missing_count == 0 and unlisted_count == 0:
+            print(f"✓ All {len(MODELS)} model(s) found")
+        else:
+            if missing_count:
+                print(f"❌ {missing_count} of {len(MODELS)} model(s) not found")
+            if unlisted_count:
+                print(f"⚠️  {unlisted_count} of {len(MODELS)} model(s) not checked (could not list repository)")
+        sys.exit(0 if missing_count == 0 and unlisted_count == 0 else 1)
+
+    if (args.preset or args.models) and not HF_TRANSFER_AVAILABLE and not args.no_hf_transfer:
+        print("💡 Tip: install hf_transfer for faster downloads")
+        print("   Install with: pip install hf_transfer\n")
+
     # Create models directory
     models_dir = Path(args.dir).resolve()
     models_dir.mkdir(parents=True, exist_ok=True)
+    check_models_dir(models_dir, len(PRESETS.get(args.preset, [])) or len(args.models))
 
     # Download models
     success_count = 0
@@ -386,12 +1012,18 @@ def main():
     if args.preset:
         # Download preset
         success_count, fail_count = download_preset(
-            args.preset, models_dir, token, args.force
+            args.preset, models_dir, token,
+            args.force, args.prefer_xet, args.interactive, args.cache_layout
         )
     elif args.models:
         # Download specific models
+        if len(args.models) > 1 and not check_disk_space(args.models, models_dir, args.force):
+            sys.exit(1)
         for model_key in args.models:
-            if download_model(model_key, models_dir, token, args.force):
+            if download_model(
+                model_key, models_dir, token,
+                args.force, args.prefer_xet, args.interactive, args.cache_layout
+            ):
                 success_count += 1
             else:
                 fail_count += 1